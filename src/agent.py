@@ -1,4 +1,5 @@
 from typing import override, Optional, Literal
+from functools import cached_property
 from pydantic import BaseModel, Field
 from ichatbio.agent import IChatBioAgent
 from ichatbio.agent_response import ResponseContext
@@ -11,14 +12,17 @@ from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 import dotenv
 import asyncio
-from functools import lru_cache
+import re
+import logging
 
-from src.worms_api import WoRMS, MatchNamesParams
-from src.logging import log_species_not_found
+from src.worms_api import WoRMS, MatchNamesParams, is_valid_species_name
+from src.cache import AsyncTTLCache, normalize_species_name
 from src.tools import create_worms_tools
 
 dotenv.load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class ToolPlan(BaseModel):
     tool_name: str
@@ -32,6 +36,15 @@ class ResearchPlan(BaseModel):
     tools_planned: list[ToolPlan]
     reasoning: str
 
+    # Split once per plan; both the plan log and the system prompt read these
+    @cached_property
+    def must_call(self) -> list[ToolPlan]:
+        return [t for t in self.tools_planned if t.priority == "must_call"]
+
+    @cached_property
+    def should_call(self) -> list[ToolPlan]:
+        return [t for t in self.tools_planned if t.priority == "should_call"]
+
 
 class MarineResearchParams(BaseModel):
     species_names: list[str] = Field(
@@ -43,16 +56,33 @@ class MarineResearchParams(BaseModel):
 
 AGENT_DESCRIPTION = "Marine species research assistant using WoRMS database"
 
+MATCH_NAMES_BATCH_SIZE = 50  # WoRMS limit for AphiaRecordsByMatchNames
+APHIA_ID_CACHE_SIZE = 8192
+APHIA_ID_CACHE_TTL = 7 * 24 * 3600  # seconds - AphiaIDs are permanent, only name matches can drift
+PLAN_CACHE_SIZE = 256
+PLAN_CACHE_TTL = 3600  # seconds
+
+# "Genus species" (optionally with an infraspecific epithet) - names worth matching before the plan exists
+_BINOMIAL_RE = re.compile(r"[A-Z][a-z]+ [a-z]+(?: [a-z]+)?")
+
 
 class WoRMSReActAgent(IChatBioAgent):
     def __init__(self):
         self.worms_logic = WoRMS()
-        self._cached_lookup = lru_cache(maxsize=256)(
-            self.worms_logic.get_species_aphia_id
-        )
+        self._aphia_cache = AsyncTTLCache(maxsize=APHIA_ID_CACHE_SIZE, ttl=APHIA_ID_CACHE_TTL)
+        self._plan_cache = AsyncTTLCache(maxsize=PLAN_CACHE_SIZE, ttl=PLAN_CACHE_TTL)
         
+    def close(self) -> None:
+        """Release the WoRMS client's connections, worker threads and disk cache"""
+        self.worms_logic.close()
+    
     @override
     def get_agent_card(self) -> AgentCard:
+        return self._agent_card
+    
+    @cached_property
+    def _agent_card(self) -> AgentCard:
+        """The card is static, so it is built and validated once rather than on every request for it"""
         return AgentCard(
             name="WoRMS Agent",
             description=AGENT_DESCRIPTION,
@@ -68,6 +98,40 @@ class WoRMSReActAgent(IChatBioAgent):
         )
     
     async def _create_plan(self, request: str, species_names: list[str]) -> ResearchPlan:
+        # Planning runs at temperature 0, so a repeated query can reuse its plan instead of another LLM call.
+        # Failed planning returns None and is not cached; the fallback plan is built per request
+        plan = await self._plan_cache.get_or_load(
+            (" ".join(request.split()), tuple(species_names)),
+            self._invoke_planner,
+            request,
+            species_names
+        )
+        if plan is not None:
+            return plan
+        
+        tools_planned = [
+            ToolPlan(
+                tool_name="get_species_attributes",
+                priority="must_call",
+                reason="Get ecological traits and conservation status"
+            ),
+            ToolPlan(
+                tool_name="get_taxonomic_record",
+                priority="should_call",
+                reason="Get basic taxonomy information"
+            )
+        ]
+        
+        return ResearchPlan(
+            query_type="single_species" if len(species_names) <= 1 else "comparison",
+            species_mentioned=species_names,
+            tools_planned=tools_planned,
+            reasoning="Fallback plan: get core species information"
+        )
+    
+    @cached_property
+    def _planner_chain(self):
+        """Prompt, model and parser are the same for every request, so the chain is built once and its HTTP client reused"""
         parser = JsonOutputParser(pydantic_object=ResearchPlan)
         
         prompt = ChatPromptTemplate.from_messages([
@@ -76,6 +140,7 @@ Analyze queries and create structured execution plans.
 
 Available tools:
 - search_by_common_name: Convert common names to scientific (USE FIRST if common name)
+- get_species_overview: Full profile of one species in a single call (record, classification, distribution, names, synonyms, attributes, sources, child taxa)
 - get_species_synonyms: Alternative scientific names for a species
 - get_species_attributes: Conservation status, body size, IUCN, CITES, ecological traits
 - get_attribute_definitions: Get the tree of attribute definitions (what types of data WoRMS can store)
@@ -111,66 +176,92 @@ Species mentioned: {species}
 Create the execution plan.""")
         ])
         
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-        chain = prompt | llm | parser
+        prompt = prompt.partial(format_instructions=parser.get_format_instructions())
         
+        return prompt | ChatOpenAI(model="gpt-4o-mini", temperature=0) | parser
+    
+    @cached_property
+    def _react_llm(self) -> ChatOpenAI:
+        return ChatOpenAI(model="gpt-4o-mini")
+    
+    async def _invoke_planner(self, request: str, species_names: list[str]) -> Optional[ResearchPlan]:
         try:
-            plan = await chain.ainvoke({
-                "format_instructions": parser.get_format_instructions(),
+            plan = await self._planner_chain.ainvoke({
                 "request": request,
                 "species": species_names if species_names else "unknown"
             })
             return ResearchPlan(**plan)
         except Exception as e:
-            print(f"Warning: Plan creation failed ({e}), using fallback plan")
-            
-            tools_planned = [
-                ToolPlan(
-                    tool_name="get_species_attributes",
-                    priority="must_call",
-                    reason="Get ecological traits and conservation status"
-                ),
-                ToolPlan(
-                    tool_name="get_taxonomic_record",
-                    priority="should_call",
-                    reason="Get basic taxonomy information"
-                )
-            ]
-            
-            return ResearchPlan(
-                query_type="single_species" if len(species_names) <= 1 else "comparison",
-                species_mentioned=species_names,
-                tools_planned=tools_planned,
-                reasoning="Fallback plan: get core species information"
-            )
+            logger.warning("Plan creation failed (%s), using fallback plan", e)
+            return None
 
-    async def _resolve_common_names_parallel(self, names: list[str], context: ResponseContext) -> dict[str, str]:
+    def _match_names_requests(self, names: list[str]) -> tuple[list[list[str]], list[str]]:
+        """
+        Batches and AphiaRecordsByMatchNames URLs for names. WoRMS matches at most
+        MATCH_NAMES_BATCH_SIZE names per request; repeated names are matched once.
+        """
+        unique_names = list(dict.fromkeys(names))
+        batches = [
+            unique_names[i:i + MATCH_NAMES_BATCH_SIZE]
+            for i in range(0, len(unique_names), MATCH_NAMES_BATCH_SIZE)
+        ]
+        api_urls = [
+            self.worms_logic.build_match_names_url(MatchNamesParams(scientific_names=batch, marine_only=True))
+            for batch in batches
+        ]
+        return batches, api_urls
+    
+    async def _match_names(self, names: list[str]) -> dict[str, list]:
+        """
+        AphiaRecordsByMatchNames matches for names, keyed by input name. Batches are matched
+        concurrently; a name missing from a short or empty response maps to no matches.
+        """
+        batches, api_urls = self._match_names_requests(names)
+        
+        logger.debug("Batch matching %d names in %d request(s): %s", sum(map(len, batches)), len(api_urls), api_urls)
+        
+        raw_responses = await asyncio.gather(*(self.worms_logic.execute_request_async(api_url) for api_url in api_urls))
+        
+        if not all(isinstance(raw_response, list) for raw_response in raw_responses):
+            raise ValueError("Unexpected API response format")
+        
+        return {
+            input_name: raw_response[index] if index < len(raw_response) else []
+            for batch, raw_response in zip(batches, raw_responses)
+            for index, input_name in enumerate(batch)
+        }
+    
+    async def _collect_matches(self, names: list[str], prefetch: Optional[asyncio.Task]) -> dict[str, list]:
+        """Matches for names, reusing the prefetched match of every name the prefetch covered"""
+        prefetched = {}
+        if prefetch is not None:
+            try:
+                prefetched = {normalize_species_name(name): matches for name, matches in (await prefetch).items()}
+            except Exception as e:  # the names are matched again below
+                logger.debug("Name prefetch failed (%s)", e)
+        
+        matches_by_name = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            key = normalize_species_name(name)
+            if key in prefetched:
+                matches_by_name[name] = prefetched[key]
+            else:
+                missing.append(name)
+        
+        if missing:
+            matches_by_name.update(await self._match_names(missing))
+        return {name: matches_by_name[name] for name in dict.fromkeys(names)}
+    
+    async def _resolve_common_names_parallel(self, names: list[str], context: ResponseContext, prefetch: Optional[asyncio.Task] = None) -> dict[str, str]:
         async with context.begin_process(f"Resolving {len(names)} species names") as process:
             try:
-                loop = asyncio.get_event_loop()
-                
-                match_params = MatchNamesParams(
-                    scientific_names=names,
-                    marine_only=True
-                )
-                api_url = self.worms_logic.build_match_names_url(match_params)
-                
-                await process.log(f"Batch matching {len(names)} names")
-                
-                raw_response = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: self.worms_logic.execute_request(api_url)
-                    ),
-                    timeout=30.0
-                )
-                
-                if not isinstance(raw_response, list):
-                    await process.log("Unexpected API response format")
-                    return {}
+                matches_by_name = await asyncio.wait_for(self._collect_matches(names, prefetch), timeout=30.0)
                 
                 resolved = {}
-                for input_name, matches in zip(names, raw_response):
+                match_lines = []
+                # Every requested name gets a line - one without matches is NOT FOUND
+                for input_name, matches in matches_by_name.items():
                     if matches and len(matches) > 0:
                         best = matches[0]
                         scientific_name = best.get('scientificname')
@@ -178,12 +269,20 @@ Create the execution plan.""")
                         
                         resolved[input_name] = scientific_name
                         
+                        # The match already carries the AphiaID, so the per-species lookup is free
+                        if scientific_name and best.get('AphiaID'):
+                            self._aphia_cache.set(normalize_species_name(scientific_name), best['AphiaID'])
+                        
                         if match_type == 'exact':
-                            await process.log(f"'{input_name}' → {scientific_name} [exact match]")
+                            match_lines.append(f"'{input_name}' → {scientific_name} [exact match]")
                         else:
-                            await process.log(f"'{input_name}' → {scientific_name} [fuzzy match: {match_type}]")
+                            match_lines.append(f"'{input_name}' → {scientific_name} [fuzzy match: {match_type}]")
                     else:
-                        await process.log(f"'{input_name}' → NOT FOUND")
+                        match_lines.append(f"'{input_name}' → NOT FOUND")
+                
+                # One log record for the whole batch instead of one await per name
+                if match_lines:
+                    await process.log("\n".join(match_lines))
                 
                 return resolved
                 
@@ -195,34 +294,49 @@ Create the execution plan.""")
                 return {}
     
     async def _get_cached_aphia_id(self, species_name: str, process) -> Optional[int]:
-        loop = asyncio.get_event_loop()
-        aphia_id = await loop.run_in_executor(
-            None,
-            self._cached_lookup,
+        # Misses return None without logging - callers report "not found" in their own words
+        species_name = " ".join(species_name.split())
+        if not is_valid_species_name(species_name):
+            return None
+        
+        aphia_id = await self._aphia_cache.get_or_load(
+            normalize_species_name(species_name),
+            self.worms_logic.get_species_aphia_id_async,
             species_name
         )
         
         if aphia_id:
             await process.log(f"Resolved {species_name} -> AphiaID {aphia_id}")
-        else:
-            await log_species_not_found(process, species_name)
         
         return aphia_id
     
     @override
     async def run(self, context: ResponseContext, request: str, entrypoint: str, params: MarineResearchParams):
+        # The planner almost always keeps the caller's species, so scientific names among them are
+        # matched while the LLM call runs; name resolution reuses these matches and only sends the rest
+        scientific_names = [name for name in params.species_names if _BINOMIAL_RE.fullmatch(name)]
+        prefetch = asyncio.ensure_future(self._match_names(scientific_names)) if scientific_names else None
+        try:
+            await self._research(context, request, params, prefetch)
+        finally:
+            # Stop a prefetch the plan did not use; retrieve the error of one that failed unawaited
+            if prefetch is not None and not prefetch.cancel() and not prefetch.cancelled():
+                prefetch.exception()
+    
+    async def _research(self, context: ResponseContext, request: str, params: MarineResearchParams, prefetch: Optional[asyncio.Task]):
         async with context.begin_process("Searching WoRMS") as process:
             plan = await self._create_plan(request, params.species_names)
             
             species_str = ", ".join(plan.species_mentioned)
             await process.log(f"{plan.query_type.replace('_', ' ').title()} query: {species_str}")
             
-            must_call_tools = [t.tool_name for t in plan.tools_planned if t.priority == "must_call"]
-            should_call_tools = [t.tool_name for t in plan.tools_planned if t.priority == "should_call"]
+            must_call_tools = [t.tool_name for t in plan.must_call]
+            should_call_tools = [t.tool_name for t in plan.should_call]
             
-            plan_details = f"Execution Plan: {len(must_call_tools)} required tools"
+            plan_parts = [f"Execution Plan: {len(must_call_tools)} required tools"]
             if should_call_tools:
-                plan_details += f", {len(should_call_tools)} recommended tools"
+                plan_parts.append(f"{len(should_call_tools)} recommended tools")
+            plan_details = ", ".join(plan_parts)
             
             await process.log(plan_details, data={
                 "query_type": plan.query_type,
@@ -238,12 +352,17 @@ Create the execution plan.""")
             async with context.begin_process("Resolving species names") as process:
                 await process.log(f"Batch resolving {len(plan.species_mentioned)} name(s)")
                 
-                resolved = await self._resolve_common_names_parallel(plan.species_mentioned, context)
+                resolved = await self._resolve_common_names_parallel(plan.species_mentioned, context, prefetch)
                 
                 await process.log(f"Resolved {len(resolved)}/{len(plan.species_mentioned)} species")
                 
-                for input_name, scientific_name in resolved.items():
-                    aphia_id = await self._get_cached_aphia_id(scientific_name, process)
+                scientific_names = list(resolved.values())
+                aphia_ids = await asyncio.gather(*(
+                    self._get_cached_aphia_id(scientific_name, process)
+                    for scientific_name in scientific_names
+                ))
+
+                for scientific_name, aphia_id in zip(scientific_names, aphia_ids):
                     if not aphia_id:
                         await process.log(f"Warning: Could not cache AphiaID for {scientific_name}")
 
@@ -253,9 +372,8 @@ Create the execution plan.""")
             get_cached_aphia_id_func=self._get_cached_aphia_id
         )
         
-        llm = ChatOpenAI(model="gpt-4o-mini")
         system_prompt = self._make_system_prompt_with_plan(request, plan)
-        agent = create_react_agent(llm, tools)
+        agent = create_react_agent(self._react_llm, tools)
         
         try:
             result = await agent.ainvoke(
@@ -271,18 +389,17 @@ Create the execution plan.""")
             await context.reply(f"An error occurred: {str(e)}")
     
     def _make_system_prompt_with_plan(self, request: str, plan: ResearchPlan) -> str:
-        must_call = [t for t in plan.tools_planned if t.priority == "must_call"]
-        should_call = [t for t in plan.tools_planned if t.priority == "should_call"]
+        must_call = plan.must_call
+        should_call = plan.should_call
         
-        tool_context = "\n\nEXECUTION PLAN:\n"
-        tool_context += "MUST CALL (required to answer query):\n"
-        for tool in must_call:
-            tool_context += f"  • {tool.tool_name} - {tool.reason}\n"
+        context_lines = ["\n\nEXECUTION PLAN:\n", "MUST CALL (required to answer query):\n"]
+        context_lines.extend(f"  • {tool.tool_name} - {tool.reason}\n" for tool in must_call)
         
         if should_call:
-            tool_context += "\nSHOULD CALL (for complete answer):\n"
-            for tool in should_call:
-                tool_context += f"  • {tool.tool_name} - {tool.reason}\n"
+            context_lines.append("\nSHOULD CALL (for complete answer):\n")
+            context_lines.extend(f"  • {tool.tool_name} - {tool.reason}\n" for tool in should_call)
+        
+        tool_context = "".join(context_lines)
         
         species_list = ", ".join(plan.species_mentioned) if plan.species_mentioned else "unknown"
         
@@ -328,6 +445,12 @@ Always create artifacts when retrieving data from WoRMS.
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop is not available on Windows
+        pass
+    
     agent = WoRMSReActAgent()
     print("=" * 60)
     print("WoRMS Agent Server")
@@ -335,4 +458,7 @@ if __name__ == "__main__":
     print(f"URL: http://localhost:9999")
     print(f"Status: Ready with planning capabilities")
     print("=" * 60)
-    run_agent_server(agent, host="0.0.0.0", port=9999)
\ No newline at end of file
+    try:
+        run_agent_server(agent, host="0.0.0.0", port=9999)
+    finally:
+        agent.close()
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Small caches for WoRMS lookups
+In-process entries expire after a TTL, the cache is size-bounded (LRU),
+and concurrent misses for the same key share a single load.
+The optional SQLite cache keeps responses across restarts and processes.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+import orjson
+
+
+_MISSING = object()
+
+
+def normalize_species_name(name: str) -> str:
+    """Cache key for a species name - case and whitespace insensitive"""
+    return " ".join(name.split()).lower()
+
+
+class AsyncTTLCache:
+    """
+    TTL + LRU cache for the results of coroutines.
+
+    Usage:
+        cache = AsyncTTLCache(maxsize=1024, ttl=3600)
+        aphia_id = await cache.get_or_load("orcinus orca", lookup, "Orcinus orca")
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries past maxsize"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[..., Awaitable[Any]],
+        *args: Any,
+        cache_if: Callable[[Any], bool] = lambda value: value is not None,
+    ) -> Any:
+        """
+        Return the cached value for key, or await loader(*args) to produce it.
+        Arguments are passed through rather than bound in a closure, so a cache hit allocates nothing.
+        Only results accepted by cache_if are stored (None is not cached by default,
+        so failed lookups are retried). Concurrent callers for the same key await
+        the same in-flight load.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, args, cache_if))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[..., Awaitable[Any]], args: tuple, cache_if: Callable[[Any], bool]) -> Any:
+        value = await loader(*args)
+        if cache_if(value):
+            self.set(key, value)
+        return value
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+
+class SQLiteResponseCache:
+    """
+    On-disk cache of WoRMS responses keyed by URL, shared by every agent process on the host.
+    Bodies are stored as zlib-compressed JSON. Storage errors are treated as misses,
+    so a locked or unwritable database never fails a request.
+
+    Usage:
+        cache = SQLiteResponseCache("worms_cache.sqlite3", ttl=30 * 86400)
+        data = cache.get(url)
+    """
+
+    def __init__(self, path: str, ttl: float = 30 * 86400):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS worms_responses ("
+            "url TEXT PRIMARY KEY, payload BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+
+    def get(self, url: str, default: Any = None) -> Any:
+        """Return the stored body for url, or default if missing or older than the TTL"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM worms_responses WHERE url = ? AND fetched_at > ?",
+                    (url, time.time() - self.ttl),
+                ).fetchone()
+            return orjson.loads(zlib.decompress(row[0])) if row else default
+        except (zlib.error, orjson.JSONDecodeError):
+            # A corrupt or truncated row would fail every lookup of url - drop it and refetch
+            self.delete(url)
+            return default
+        except sqlite3.Error:
+            return default
+
+    def set(self, url: str, value: Any) -> None:
+        """Store the body for url, replacing any older copy"""
+        payload = zlib.compress(orjson.dumps(value))
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO worms_responses (url, payload, fetched_at) VALUES (?, ?, ?)",
+                    (url, payload, time.time()),
+                )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, url: str) -> None:
+        """Remove the stored body for url, if any"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM worms_responses WHERE url = ?", (url,))
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -53,12 +53,9 @@ async def log_api_call(process, tool_name: str, species_name: str, aphia_id: int
 
 
 async def log_data_fetched(process, tool_name: str, species_name: str, count: int):
-    """Log data fetched - SIMPLIFIED (count visible in message)"""
-    await log(
-        process,
-        f"Found {count} record(s) for {species_name}",
-        LogCategory.TOOL
-    )
+    """Log data fetched - DISABLED (count visible in artifact description)"""
+    # Every artifact description carries the record count, no need for a second message
+    pass
 
 
 async def log_no_data(process, tool_name: str, species_name: str, aphia_id: int):
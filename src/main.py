@@ -1,9 +1,19 @@
 import os
+import asyncio
 from ichatbio.server import run_agent_server
 from agent import WoRMSReActAgent 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop is not available on Windows
+        pass
+    
     agent = WoRMSReActAgent()  
     port = int(os.getenv("PORT", 9999))
     print(f"Starting WoRMS ReAct Agent on port {port}")
-    run_agent_server(agent, host="0.0.0.0", port=port)
\ No newline at end of file
+    try:
+        run_agent_server(agent, host="0.0.0.0", port=port)
+    finally:
+        agent.close()
\ No newline at end of file
@@ -1,8 +1,11 @@
 import asyncio
-from typing import Callable
+from typing import Any, Callable, NamedTuple, Optional
 from functools import wraps
 from langchain.tools import tool
 from src.worms_api import  (
+    WoRMS,
+    WoRMSRequestError,
+    WoRMSTimeoutError,
     SynonymsParams,
     DistributionParams,
     VernacularParams,
@@ -18,6 +21,8 @@ from src.worms_api import  (
     RecordsByDateParams
 )
 from src.logging import (
+    LogCategory,
+    log,
     log_species_not_found,
     log_api_call,
     log_data_fetched,
@@ -27,8 +32,110 @@ from src.logging import (
 )
 
 
+def _as_list(raw_response: Any) -> list:
+    """Normalize a WoRMS response to a list: lists pass through, a single record is wrapped, empty becomes []"""
+    return raw_response if type(raw_response) is list else [raw_response] if raw_response else []
+
+
+class SpeciesEndpoint(NamedTuple):
+    """How a per-species WoRMS endpoint is fetched, reported and stored as an artifact"""
+    subject: str                                 # process title / error reply, e.g. "distribution"
+    no_data: str                                 # what is reported missing, e.g. "distribution data"
+    label: str                                   # artifact description prefix
+    unit: Optional[str]                          # what each record counts as; None for single-record endpoints
+    build_url: Callable[..., str]                # (worms, aphia_id, **url_params) - url_params come from the tool call, e.g. offset
+    metadata: Optional[Callable[..., dict[str, Any]]] = None  # (records, **url_params)
+    paginated: bool = False
+
+
+# WoRMS returns list endpoints in pages of this many records
+WORMS_PAGE_SIZE = 50
+
+_RECORD_METADATA_KEYS = ("rank", "status")
+
+
+def _record_metadata(records: list) -> dict[str, Any]:
+    record = records[0]
+    if type(record) is not dict:
+        return dict.fromkeys(_RECORD_METADATA_KEYS, '')
+    return {key: record.get(key, '') for key in _RECORD_METADATA_KEYS}
+
+
+def _attributes_metadata(records: list) -> dict[str, Any]:
+    return {
+        "attribute_types": sorted({a.get('measurementType', '') for a in records if isinstance(a, dict)})
+    }
+
+
+def _children_metadata(records: list, offset: int = 1) -> dict[str, Any]:
+    offset = max(1, offset)
+    metadata = {
+        "ranks": sorted({c['rank'] for c in records if isinstance(c, dict) and c.get('rank')})
+    }
+    # One page is fetched per call; a full page means get_child_taxa can continue from next_offset
+    if len(records) >= WORMS_PAGE_SIZE:
+        metadata["next_offset"] = offset + WORMS_PAGE_SIZE
+    return metadata
+
+
+# AphiaIDs come from WoRMS itself, so the params models are built without re-validation
+SPECIES_ENDPOINTS: dict[str, SpeciesEndpoint] = {
+    "get_species_synonyms": SpeciesEndpoint(
+        "synonyms", "synonyms", "Synonyms", "records",
+        lambda worms, aphia_id: worms.build_synonyms_url(SynonymsParams.model_construct(aphia_id=aphia_id)),
+        paginated=True
+    ),
+    "get_species_distribution": SpeciesEndpoint(
+        "distribution", "distribution data", "Distribution", "locations",
+        lambda worms, aphia_id: worms.build_distribution_url(DistributionParams.model_construct(aphia_id=aphia_id))
+    ),
+    "get_vernacular_names": SpeciesEndpoint(
+        "vernacular names", "vernacular names", "Vernacular names", "names",
+        lambda worms, aphia_id: worms.build_vernacular_url(VernacularParams.model_construct(aphia_id=aphia_id))
+    ),
+    "get_literature_sources": SpeciesEndpoint(
+        "literature sources", "literature sources", "Literature sources", "sources",
+        lambda worms, aphia_id: worms.build_sources_url(SourcesParams.model_construct(aphia_id=aphia_id))
+    ),
+    "get_taxonomic_record": SpeciesEndpoint(
+        "taxonomic record", "taxonomic record", "Taxonomic record", None,
+        lambda worms, aphia_id: worms.build_record_url(RecordParams.model_construct(aphia_id=aphia_id)),
+        metadata=_record_metadata
+    ),
+    "get_taxonomic_classification": SpeciesEndpoint(
+        "classification", "classification", "Taxonomic classification", None,
+        lambda worms, aphia_id: worms.build_classification_url(ClassificationParams.model_construct(aphia_id=aphia_id))
+    ),
+    "get_child_taxa": SpeciesEndpoint(
+        "child taxa", "child taxa", "Child taxa", "children",
+        lambda worms, aphia_id, offset=1: worms.build_children_url(ChildrenParams.model_construct(aphia_id=aphia_id, offset=offset)),
+        metadata=_children_metadata
+    ),
+    "get_species_attributes": SpeciesEndpoint(
+        "attributes", "ecological attributes", "Ecological attributes", "attributes",
+        lambda worms, aphia_id: worms.build_attributes_url(AttributesParams.model_construct(aphia_id=aphia_id)),
+        metadata=_attributes_metadata
+    ),
+}
+
+
+def _error_reply(subject: str, error: Exception) -> str:
+    """Tool reply for a failed lookup - timeouts and HTTP errors get a specific message the agent can act on"""
+    if isinstance(error, WoRMSTimeoutError):
+        return f"WoRMS timed out retrieving {subject}. Please retry."
+    if isinstance(error, WoRMSRequestError) and error.status:
+        return f"WoRMS returned HTTP {error.status} retrieving {subject}."
+    return f"Error retrieving {subject}: {str(error)}"
+
+
+# Cap on in-flight WoRMS calls per request, so one request's fan-out cannot
+# occupy the whole worker pool shared with other conversations
+MAX_CONCURRENT_FETCHES = 8
+
+
 def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable):
     tool_call_tracker = {}
+    fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
     
     def create_tracked_key(tool_name: str, **kwargs) -> str:
         """Create a unique key for tool + arguments"""
@@ -72,24 +179,26 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         return aphia_id, None
     
 
-    async def fetch_paginated_data(process, api_url_func, batch_size=50):
+    async def fetch_json(api_url: str):
+        """Fetch a WoRMS URL, waiting for a free slot when this request already has MAX_CONCURRENT_FETCHES in flight"""
+        async with fetch_slots:
+            return await worms_logic.execute_request_async(api_url)
+    
+
+    async def fetch_paginated_data(process, api_url_func, batch_size=WORMS_PAGE_SIZE):
         """
         Fetch all data with pagination support.
         api_url_func should be a function that takes offset and returns the API URL
         """
-        loop = asyncio.get_event_loop()
         all_data = []
         offset = 1
         
         while True:
             api_url = api_url_func(offset)
             
-            raw_response = await loop.run_in_executor(
-                None,
-                lambda url=api_url: worms_logic.execute_request(url)
-            )
+            raw_response = await fetch_json(api_url)
             
-            batch = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+            batch = _as_list(raw_response)
             
             if not batch:
                 break
@@ -104,6 +213,80 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         return all_data
     
 
+    async def fetch_species_records(tool_name: str, api_url: str) -> list:
+        """Fetch one per-species endpoint and normalize it to a list of records"""
+        if SPECIES_ENDPOINTS[tool_name].paginated:
+            def url_builder(offset):
+                if offset == 1:
+                    return api_url
+                separator = '&' if '?' in api_url else '?'
+                return f"{api_url}{separator}offset={offset}"
+            
+            return await fetch_paginated_data(None, url_builder)
+        
+        return _as_list(await fetch_json(api_url))
+    
+
+    async def create_species_artifact(process, tool_name: str, species_name: str, aphia_id: int, api_url: str, records: list, **url_params):
+        """Log the record count and create the JSON artifact for one per-species endpoint"""
+        endpoint = SPECIES_ENDPOINTS[tool_name]
+        count = len(records) if endpoint.unit else 1
+        await log_data_fetched(process, tool_name, species_name, count)
+        
+        description = f"{endpoint.label} for {species_name} (AphiaID: {aphia_id})"
+        metadata = {"aphia_id": aphia_id}
+        if endpoint.unit:
+            description += f" - {count} {endpoint.unit}"
+            metadata["count"] = count
+        metadata["species"] = species_name
+        if endpoint.metadata:
+            metadata.update(endpoint.metadata(records, **url_params))
+        
+        await process.create_artifact(
+            mimetype="application/json",
+            description=description,
+            uris=[api_url],
+            metadata=metadata
+        )
+        
+        await log_artifact_created(process, tool_name, species_name)
+    
+
+    async def run_species_lookup(tool_name: str, species_name: str, **url_params) -> str:
+        """
+        Shared body of the per-species tools: resolve AphiaID, fetch the endpoint, create the artifact.
+        url_params (e.g. offset) are passed to the endpoint's URL builder and metadata.
+        """
+        endpoint = SPECIES_ENDPOINTS[tool_name]
+        async with context.begin_process(f"Searching WoRMS for {endpoint.subject} of {species_name}") as process:
+            try:
+                aphia_id, error = await get_species_or_fail(species_name, process, tool_name)
+                if error:
+                    return error
+                
+                if url_params:
+                    api_url = endpoint.build_url(worms_logic, aphia_id, **url_params)
+                else:
+                    api_url = worms_logic.species_url(tool_name, aphia_id, endpoint.build_url)
+                
+                # Send the call log while the request is in flight instead of ahead of it
+                records, _ = await asyncio.gather(
+                    fetch_species_records(tool_name, api_url),
+                    log_api_call(process, tool_name, species_name, aphia_id, api_url)
+                )
+                
+                if not records:
+                    await log_no_data(process, tool_name, species_name, aphia_id)
+                    return f"No {endpoint.no_data} found for {species_name}"
+                
+                await create_species_artifact(process, tool_name, species_name, aphia_id, api_url, records, **url_params)
+                return ""  # Return empty string - artifact contains the data
+                    
+            except Exception as e:
+                await log_tool_error(process, tool_name, species_name, e)
+                return _error_reply(endpoint.subject, e)
+    
+
     
     @tool(return_direct=True)
     async def abort(reason: str):
@@ -120,329 +303,91 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
     @cache_tool_result
     async def get_species_synonyms(species_name: str) -> str:
         """Get synonyms and alternative scientific names for a marine species."""
-        async with context.begin_process(f"Searching WoRMS for synonyms of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_species_synonyms")
-                if error:
-                    return error
-                
-                # Paginated fetch with offset
-                def url_builder(offset):
-                    syn_params = SynonymsParams(aphia_id=aphia_id)
-                    api_url = worms_logic.build_synonyms_url(syn_params)
-                    if offset > 1:
-                        separator = '&' if '?' in api_url else '?'
-                        api_url = f"{api_url}{separator}offset={offset}"
-                    return api_url
-                
-                base_url = url_builder(1)
-                await log_api_call(process, "get_species_synonyms", species_name, aphia_id, base_url)
-                
-                all_synonyms = await fetch_paginated_data(process, url_builder)
-                
-                if not all_synonyms:
-                    await log_no_data(process, "get_species_synonyms", species_name, aphia_id)
-                    return f"No synonyms found for {species_name}"
-                
-                await log_data_fetched(process, "get_species_synonyms", species_name, len(all_synonyms))
-                
-                syn_params = SynonymsParams(aphia_id=aphia_id)
-                base_api_url = worms_logic.build_synonyms_url(syn_params)
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Synonyms for {species_name} (AphiaID: {aphia_id}) - {len(all_synonyms)} records",
-                    uris=[base_api_url],
-                    metadata={
-                        "aphia_id": aphia_id, 
-                        "count": len(all_synonyms),
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_species_synonyms", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_species_synonyms", species_name, e)
-                return f"Error retrieving synonyms: {str(e)}"
+        return await run_species_lookup("get_species_synonyms", species_name)
 
     @tool
     @cache_tool_result
     async def get_species_distribution(species_name: str) -> str:
         """Get geographic distribution and range data for a marine species. Shows where the species is found globally."""
-        async with context.begin_process(f"Searching WoRMS for distribution of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_species_distribution")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                dist_params = DistributionParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_distribution_url(dist_params)
-                
-                await log_api_call(process, "get_species_distribution", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                distributions = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
-                
-                if not distributions:
-                    await log_no_data(process, "get_species_distribution", species_name, aphia_id)
-                    return f"No distribution data found for {species_name}"
-                
-                await log_data_fetched(process, "get_species_distribution", species_name, len(distributions))
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Distribution for {species_name} (AphiaID: {aphia_id}) - {len(distributions)} locations",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id, 
-                        "count": len(distributions),
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_species_distribution", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_species_distribution", species_name, e)
-                return f"Error retrieving distribution: {str(e)}"
+        return await run_species_lookup("get_species_distribution", species_name)
 
     @tool
     @cache_tool_result
     async def get_vernacular_names(species_name: str) -> str:
         """Get common names for a marine species in different languages. Useful for finding local or colloquial names."""
-        async with context.begin_process(f"Searching WoRMS for vernacular names of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_vernacular_names")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                vern_params = VernacularParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_vernacular_url(vern_params)
-                
-                await log_api_call(process, "get_vernacular_names", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                vernaculars = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
-                
-                if not vernaculars:
-                    await log_no_data(process, "get_vernacular_names", species_name, aphia_id)
-                    return f"No vernacular names found for {species_name}"
-                
-                await log_data_fetched(process, "get_vernacular_names", species_name, len(vernaculars))
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Vernacular names for {species_name} (AphiaID: {aphia_id}) - {len(vernaculars)} names",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id, 
-                        "count": len(vernaculars),
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_vernacular_names", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_vernacular_names", species_name, e)
-                return f"Error retrieving vernacular names: {str(e)}"
+        return await run_species_lookup("get_vernacular_names", species_name)
 
     @tool
     @cache_tool_result
     async def get_literature_sources(species_name: str) -> str:
         """Get scientific literature sources, references, and citations for a marine species. Provides academic sources."""
-        async with context.begin_process(f"Searching WoRMS for literature sources of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_literature_sources")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                sources_params = SourcesParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_sources_url(sources_params)
-                
-                await log_api_call(process, "get_literature_sources", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                sources = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
-                
-                if not sources:
-                    await log_no_data(process, "get_literature_sources", species_name, aphia_id)
-                    return f"No literature sources found for {species_name}"
-                
-                await log_data_fetched(process, "get_literature_sources", species_name, len(sources))
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Literature sources for {species_name} (AphiaID: {aphia_id}) - {len(sources)} sources",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id, 
-                        "count": len(sources),
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_literature_sources", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_literature_sources", species_name, e)
-                return f"Error retrieving literature sources: {str(e)}"
+        return await run_species_lookup("get_literature_sources", species_name)
 
     @tool
     @cache_tool_result
     async def get_taxonomic_record(species_name: str) -> str:
         """Get basic taxonomic record including family, order, class, status, and authority. Good for quick taxonomy overview."""
-        async with context.begin_process(f"Searching WoRMS for taxonomic record of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_taxonomic_record")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                record_params = RecordParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_record_url(record_params)
-                
-                await log_api_call(process, "get_taxonomic_record", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                if not raw_response:
-                    await log_no_data(process, "get_taxonomic_record", species_name, aphia_id)
-                    return f"No taxonomic record found for {species_name}"
-                
-                await log_data_fetched(process, "get_taxonomic_record", species_name, 1)
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Taxonomic record for {species_name} (AphiaID: {aphia_id})",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id,
-                        "species": species_name,
-                        "rank": raw_response.get('rank', '') if isinstance(raw_response, dict) else '',
-                        "status": raw_response.get('status', '') if isinstance(raw_response, dict) else ''
-                    }
-                )
-                
-                await log_artifact_created(process, "get_taxonomic_record", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_taxonomic_record", species_name, e)
-                return f"Error retrieving taxonomic record: {str(e)}"
+        return await run_species_lookup("get_taxonomic_record", species_name)
 
     @tool
     @cache_tool_result
     async def get_taxonomic_classification(species_name: str) -> str:
         """Get full taxonomic classification hierarchy from kingdom to species. Shows complete taxonomic tree."""
-        async with context.begin_process(f"Searching WoRMS for classification of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_taxonomic_classification")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                class_params = ClassificationParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_classification_url(class_params)
-                
-                await log_api_call(process, "get_taxonomic_classification", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                if not raw_response:
-                    await log_no_data(process, "get_taxonomic_classification", species_name, aphia_id)
-                    return f"No classification found for {species_name}"
-                
-                await log_data_fetched(process, "get_taxonomic_classification", species_name, 1)
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Taxonomic classification for {species_name} (AphiaID: {aphia_id})",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id,
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_taxonomic_classification", species_name)
-                return ""  # Return empty string - artifact contains the data
-                    
-            except Exception as e:
-                await log_tool_error(process, "get_taxonomic_classification", species_name, e)
-                return f"Error retrieving classification: {str(e)}"
+        return await run_species_lookup("get_taxonomic_classification", species_name)
 
     @tool
     @cache_tool_result
-    async def get_child_taxa(species_name: str) -> str:
-        """Get child taxa (subspecies, varieties) under a taxonomic group. Useful for finding related species."""
-        async with context.begin_process(f"Searching WoRMS for child taxa of {species_name}") as process:
+    async def get_child_taxa(species_name: str, offset: int = 1) -> str:
+        """Get child taxa (subspecies, varieties) under a taxonomic group. Useful for finding related species. Returns 50 children per call; pass the artifact's next_offset to get the next page."""
+        # WoRMS offsets start at 1
+        return await run_species_lookup("get_child_taxa", species_name, offset=max(1, offset))
+
+    @tool
+    @cache_tool_result
+    async def get_species_overview(species_name: str) -> str:
+        """Get a full profile of a marine species in one call: taxonomic record, classification, distribution, vernacular names, synonyms, attributes, literature sources and child taxa. Use when the user wants everything about a species."""
+        async with context.begin_process(f"Searching WoRMS for a full profile of {species_name}") as process:
             try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_child_taxa")
+                aphia_id, error = await get_species_or_fail(species_name, process, "get_species_overview")
                 if error:
                     return error
                 
-                loop = asyncio.get_event_loop()
-                children_params = ChildrenParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_children_url(children_params)
-                
-                await log_api_call(process, "get_child_taxa", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
+                # Resolve once, then fetch every endpoint concurrently
+                tool_names = list(SPECIES_ENDPOINTS)
+                api_urls = [worms_logic.species_url(name, aphia_id, SPECIES_ENDPOINTS[name].build_url) for name in tool_names]
+                
+                # A failed section is reported on its own; a failed log still fails the tool
+                results, _ = await asyncio.gather(
+                    asyncio.gather(
+                        *(fetch_species_records(name, url) for name, url in zip(tool_names, api_urls)),
+                        return_exceptions=True
+                    ),
+                    log(
+                        process,
+                        f"get_species_overview: {species_name}",
+                        LogCategory.TOOL,
+                        data={"species": species_name, "aphia_id": aphia_id, "urls": api_urls}
+                    )
                 )
                 
-                children = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                # Sections report ordinary failures; a cancelled fetch (or any other BaseException) cancels the overview
+                for records in results:
+                    if isinstance(records, BaseException) and not isinstance(records, Exception):
+                        raise records
                 
-                if not children:
-                    await log_no_data(process, "get_child_taxa", species_name, aphia_id)
-                    return f"No child taxa found for {species_name}"
+                for tool_name, api_url, records in zip(tool_names, api_urls, results):
+                    if isinstance(records, Exception):
+                        await log_tool_error(process, tool_name, species_name, records)
+                    elif not records:
+                        await log_no_data(process, tool_name, species_name, aphia_id)
+                    else:
+                        await create_species_artifact(process, tool_name, species_name, aphia_id, api_url, records)
                 
-                await log_data_fetched(process, "get_child_taxa", species_name, len(children))
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Child taxa for {species_name} (AphiaID: {aphia_id}) - {len(children)} children",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id,
-                        "count": len(children),
-                        "species": species_name
-                    }
-                )
-                
-                await log_artifact_created(process, "get_child_taxa", species_name)
-                return ""  # Return empty string - artifact contains the data
+                return ""  # Return empty string - artifacts contain the data
                     
             except Exception as e:
-                await log_tool_error(process, "get_child_taxa", species_name, e)
-                return f"Error retrieving child taxa: {str(e)}"
+                await log_tool_error(process, "get_species_overview", species_name, e)
+                return _error_reply("species overview", e)
 
     @tool
     @cache_tool_result
@@ -454,18 +399,14 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                 if error:
                     return error
                 
-                loop = asyncio.get_event_loop()
                 ext_params = ExternalIDParams(aphia_id=aphia_id, id_type=id_type)
                 api_url = worms_logic.build_external_id_url(ext_params)
                 
                 await log_api_call(process, "get_external_ids", species_name, aphia_id, api_url)
                 
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
+                raw_response = await fetch_json(api_url)
                 
-                external_ids = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                external_ids = _as_list(raw_response)
                 
                 if not external_ids:
                     await log_no_data(process, "get_external_ids", species_name, aphia_id)
@@ -492,55 +433,13 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                     
             except Exception as e:
                 await log_tool_error(process, "get_external_ids", species_name, e)
-                return f"Error retrieving external IDs: {str(e)}"
+                return _error_reply("external IDs", e)
 
     @tool
     @cache_tool_result
     async def get_species_attributes(species_name: str) -> str:
         """Get ecological attributes, traits, and characteristics (IUCN status, body size, depth range, habitat). Provides conservation and ecological data."""
-        async with context.begin_process(f"Searching WoRMS for attributes of {species_name}") as process:
-            try:
-                aphia_id, error = await get_species_or_fail(species_name, process, "get_species_attributes")
-                if error:
-                    return error
-                
-                loop = asyncio.get_event_loop()
-                attr_params = AttributesParams(aphia_id=aphia_id)
-                api_url = worms_logic.build_attributes_url(attr_params)
-                
-                await log_api_call(process, "get_species_attributes", species_name, aphia_id, api_url)
-                
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
-                
-                attributes = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
-                
-                if not attributes:
-                    await log_no_data(process, "get_species_attributes", species_name, aphia_id)
-                    return f"No ecological attributes found for {species_name}"
-                
-                await log_data_fetched(process, "get_species_attributes", species_name, len(attributes))
-                
-                await process.create_artifact(
-                    mimetype="application/json",
-                    description=f"Ecological attributes for {species_name} (AphiaID: {aphia_id}) - {len(attributes)} attributes",
-                    uris=[api_url],
-                    metadata={
-                        "aphia_id": aphia_id, 
-                        "count": len(attributes),
-                        "species": species_name,
-                        "attribute_types": list(set([a.get('measurementType', '') for a in attributes if isinstance(a, dict)]))
-                    }
-                )
-
-                await log_artifact_created(process, "get_species_attributes", species_name)
-                return ""  # Return empty string - artifact contains the data
-                        
-            except Exception as e:
-                await log_tool_error(process, "get_species_attributes", species_name, e)
-                return f"Error retrieving attributes: {str(e)}"
+        return await run_species_lookup("get_species_attributes", species_name)
 
     @tool
     @cache_tool_result
@@ -548,36 +447,17 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         """Search for species using common names like 'killer whale' or 'great white shark'. Returns matching species with scientific names."""
         async with context.begin_process(f"Searching WoRMS for species with common name '{common_name}'") as process:
             try:
-                loop = asyncio.get_event_loop()
                 search_params = VernacularSearchParams(vernacular_name=common_name, like=True)
                 api_url = worms_logic.build_vernacular_search_url(search_params)
                 
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
+                raw_response = await fetch_json(api_url)
                 
-                results = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                results = _as_list(raw_response)
                 
                 if not results:
                     await process.log(f"No species found with common name '{common_name}'")
                     return f"No species found with common name '{common_name}'. Try a different name or use scientific name."
                 
-                await process.log(f"Found {len(results)} species matching '{common_name}'")
-                
-                species_list = []
-                for result in results[:10]:
-                    if isinstance(result, dict):
-                        scientific_name = result.get('scientificname', 'Unknown')
-                        aphia_id = result.get('AphiaID', 'Unknown')
-                        status = result.get('status', 'Unknown')
-                        authority = result.get('authority', '')
-                        
-                        species_info = f"{scientific_name} (AphiaID: {aphia_id}, Status: {status})"
-                        if authority:
-                            species_info += f" - {authority}"
-                        species_list.append(species_info)
-                
                 await process.create_artifact(
                     mimetype="application/json",
                     description=f"Search results for common name '{common_name}' - {len(results)} species found",
@@ -601,18 +481,14 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         """Get the tree of available attribute types in WoRMS. Shows what ecological data categories exist (use attribute_id=0 for root)."""
         async with context.begin_process(f"Searching WoRMS for attribute definitions (ID: {attribute_id})") as process:
             try:
-                loop = asyncio.get_event_loop()
                 keys_params = AttributeKeysParams(attribute_id=attribute_id, include_children=include_children)
                 api_url = worms_logic.build_attribute_keys_url(keys_params)
                 
                 await log_api_call(process, "get_attribute_definitions", f"Attribute ID {attribute_id}", None, api_url)
                 
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
+                raw_response = await fetch_json(api_url)
                 
-                definitions = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                definitions = _as_list(raw_response)
                 
                 if not definitions:
                     await log_no_data(process, "get_attribute_definitions", f"Attribute ID {attribute_id}", None)
@@ -636,7 +512,7 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                         
             except Exception as e:
                 await log_tool_error(process, "get_attribute_definitions", f"Attribute ID {attribute_id}", e)
-                return f"Error retrieving attribute definitions: {str(e)}"
+                return _error_reply("attribute definitions", e)
             
     @tool
     @cache_tool_result
@@ -644,18 +520,14 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         """Get possible values for a specific attribute category. Use after get_attribute_definitions to find valid options."""
         async with context.begin_process(f"Searching WoRMS for attribute values in category {category_id}") as process:
             try:
-                loop = asyncio.get_event_loop()
                 values_params = AttributeValuesByCategoryParams(category_id=category_id)
                 api_url = worms_logic.build_attribute_values_by_category_url(values_params)
                 
                 await log_api_call(process, "get_attribute_value_options", f"Category {category_id}", None, api_url)
                 
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
+                raw_response = await fetch_json(api_url)
                 
-                values = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                values = _as_list(raw_response)
                 
                 if not values:
                     await log_no_data(process, "get_attribute_value_options", f"Category {category_id}", None)
@@ -678,7 +550,7 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                         
             except Exception as e:
                 await log_tool_error(process, "get_attribute_value_options", f"Category {category_id}", e)
-                return f"Error retrieving attribute values: {str(e)}"
+                return _error_reply("attribute values", e)
 
     @tool
     @cache_tool_result
@@ -686,7 +558,6 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
         """Get species added or modified in WoRMS during a date range. Useful for tracking new discoveries and taxonomic updates. Use ISO 8601 format (e.g., '2024-01-01T00:00:00+00:00')."""
         async with context.begin_process(f"Searching WoRMS for species changes since {start_date}") as process:
             try:
-                loop = asyncio.get_event_loop()
                 date_params = RecordsByDateParams(
                     startdate=start_date,
                     enddate=end_date,
@@ -698,12 +569,9 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                 
                 await log_api_call(process, "get_recent_species_changes", f"Date range {start_date} to {end_date or 'today'}", None, api_url)
                 
-                raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: worms_logic.execute_request(api_url)
-                )
+                raw_response = await fetch_json(api_url)
                 
-                records = raw_response if isinstance(raw_response, list) else [raw_response] if raw_response else []
+                records = _as_list(raw_response)
                 
                 if not records:
                     await log_no_data(process, "get_recent_species_changes", f"Date range {start_date} to {end_date or 'today'}", None)
@@ -738,9 +606,10 @@ def create_worms_tools(worms_logic, context, get_cached_aphia_id_func: Callable)
                         
             except Exception as e:
                 await log_tool_error(process, "get_recent_species_changes", f"Date range {start_date} to {end_date or 'today'}", e)
-                return f"Error retrieving recent changes: {str(e)}"
+                return _error_reply("recent changes", e)
 
     return [
+        get_species_overview,
         get_species_synonyms,
         get_species_distribution,
         get_vernacular_names,
@@ -1,10 +1,53 @@
 import os
+import re
+import asyncio
+import contextvars
+import threading
 import yaml
+import orjson
 import requests
 from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from typing import Optional, Dict, Any, Callable
+from collections import OrderedDict
 from urllib.parse import urlencode, quote
+from concurrent.futures import ThreadPoolExecutor
 import cloudscraper
+from urllib3.util.retry import Retry
+
+from src.cache import AsyncTTLCache, SQLiteResponseCache
+
+
+# Taxon names: a leading letter, then letters, digits, spaces and the punctuation used
+# in names like "Mytilus (Mytilus) edulis", "Alexandrium sp." or "Acropora × prolifera"
+_SPECIES_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9 .,'()×&-]{1,199}")
+
+
+def is_valid_species_name(name: str) -> bool:
+    """Cheap pre-check that rejects names WoRMS cannot match (empty, symbols, control characters)"""
+    return bool(name) and _SPECIES_NAME_RE.fullmatch(name.strip()) is not None
+
+
+SPECIES_URL_CACHE_SIZE = 4096
+
+# Endpoints whose answer depends on the current date - an AphiaRecordsByDate query without
+# an end date means "until now" - so a stored response would go stale
+_VOLATILE_ENDPOINTS = ("/AphiaRecordsByDate",)
+
+
+def is_cacheable_url(url: str) -> bool:
+    """Whether a WoRMS response for url may be served from the response caches"""
+    return not any(endpoint in url for endpoint in _VOLATILE_ENDPOINTS)
+
+
+class WoRMSRequestError(ConnectionError):
+    """A WoRMS request failed; status is the HTTP status code when WoRMS answered with an error"""
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class WoRMSTimeoutError(WoRMSRequestError):
+    """WoRMS did not answer within the configured timeout"""
 
 
 class SpeciesSearchParams(BaseModel):
@@ -70,6 +113,9 @@ class ChildrenParams(BaseModel):
         description="The AphiaID of the species to get child taxa for",
         examples=[137205, 104625, 137094]
     )
+    offset: Optional[int] = Field(1,
+        description="Starting record number for pagination (default: 1)"
+    )
 
 class ExternalIDParams(BaseModel):
     """Parameters for getting external database IDs"""
@@ -165,13 +211,78 @@ class WoRMS:
     def __init__(self):
         self.worms_api_base_url = self._get_config_value("WORMS_API_URL", "https://www.marinespecies.org/rest")
         
+        max_workers = int(self._get_config_value("WORMS_THREAD_POOL_SIZE", "16"))
+        pool_size = int(self._get_config_value("WORMS_HTTP_POOL_SIZE", str(max_workers)))
+        
+        # (connect, read) - fail fast when WoRMS is unreachable, but leave large result sets time to arrive
+        self._timeout = (
+            float(self._get_config_value("WORMS_CONNECT_TIMEOUT", "5")),
+            float(self._get_config_value("WORMS_READ_TIMEOUT", "60")),
+        )
+        
+        # Dedicated, bounded pool for the blocking HTTP calls so WoRMS fan-out
+        # neither starves nor is starved by other users of the default executor
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="worms")
+        
+        # URL -> (ETag, Last-Modified, parsed body) for conditional re-fetches
+        self._validator_cache: OrderedDict[str, tuple[Optional[str], Optional[str], Any]] = OrderedDict()
+        self._validator_cache_size = int(self._get_config_value("WORMS_CONDITIONAL_CACHE_SIZE", "1024"))
+        self._validator_lock = threading.Lock()
+        
+        # (endpoint, AphiaID) -> URL for the per-species endpoints. Kept per client, so it goes away with it
+        self._species_urls: OrderedDict[tuple[str, int], str] = OrderedDict()
+        
+        # URL -> parsed body, so repeat lookups within the TTL skip the network entirely.
+        # Failed requests raise, so error responses are never cached
+        self._response_cache = AsyncTTLCache(
+            maxsize=int(self._get_config_value("WORMS_RESPONSE_CACHE_SIZE", "4096")),
+            ttl=float(self._get_config_value("WORMS_RESPONSE_CACHE_TTL", "3600")),
+        )
+        
+        # Optional on-disk cache so responses survive restarts and are shared between processes
+        disk_cache_path = self._get_config_value("WORMS_DISK_CACHE_PATH")
+        self._disk_cache = SQLiteResponseCache(
+            disk_cache_path,
+            ttl=float(self._get_config_value("WORMS_DISK_CACHE_TTL", str(30 * 86400))),
+        ) if disk_cache_path else None
+        
+        # Rate limiting (429) and transient 5xx answers are retried with exponential backoff.
+        # Retry-After is ignored: urllib3 sleeps for it uncapped, which would park a worker thread
+        # for as long as WoRMS asks. Read timeouts are not retried - the read timeout already bounds the wait
+        retry = Retry(
+            total=int(self._get_config_value("WORMS_MAX_RETRIES", "3")),
+            read=False,
+            backoff_factor=0.25,
+            backoff_max=8,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        
         self.session = cloudscraper.create_scraper()
+        # Re-mount the cipher suite adapter with a pool large enough for concurrent tool calls,
+        # so keep-alive connections are reused instead of discarded once the default 10 are busy
+        self.session.mount('https://', cloudscraper.CipherSuiteAdapter(
+            cipherSuite=self.session.cipherSuite,
+            ecdhCurve=self.session.ecdhCurve,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        ))
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
             'Accept': 'application/json',
             'Accept-Language': 'en-US,en;q=0.9',
         })
 
+    def close(self) -> None:
+        """Release pooled connections, worker threads and the on-disk cache"""
+        self.session.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
     def _get_config_value(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get configuration value from environment or YAML file"""
         value = os.getenv(key)
@@ -222,7 +333,10 @@ class WoRMS:
 
     def build_children_url(self, params: ChildrenParams) -> str:
         """Build URL for getting species child taxa"""
-        return f"{self.worms_api_base_url}/AphiaChildrenByAphiaID/{params.aphia_id}"
+        base_url = f"{self.worms_api_base_url}/AphiaChildrenByAphiaID/{params.aphia_id}"
+        if params.offset and params.offset > 1:
+            return f"{base_url}?offset={params.offset}"
+        return base_url
     
     def build_external_id_url(self, params: ExternalIDParams) -> str:
         """Build URL for getting external database IDs"""
@@ -306,30 +420,118 @@ class WoRMS:
         return f"{self.worms_api_base_url}/AphiaRecordsByDate?{query_string}"
 
 
-    def execute_request(self, url: str) -> Dict:
-        """Execute GET request and return JSON response"""
+    def execute_request(self, url: str, cacheable: Optional[bool] = None) -> Dict:
+        """
+        Execute GET request and return JSON response.
+        cacheable=False bypasses the on-disk cache; by default it is decided by is_cacheable_url.
+        """
+        if cacheable is None:
+            cacheable = is_cacheable_url(url)
+        disk_cache = self._disk_cache if cacheable else None
+        
+        if disk_cache is not None:
+            stored = disk_cache.get(url)
+            if stored is not None:
+                return stored
+        
+        with self._validator_lock:
+            cached = self._validator_cache.get(url)
+        
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
         try:
-            response = self.session.get(url, timeout=60)
+            response = self.session.get(url, timeout=self._timeout, headers=headers)
+            # Unchanged since the last fetch - reuse the parsed body, no download or decode
+            if response.status_code == 304 and cached:
+                return cached[2]
             response.raise_for_status()
+            # WoRMS answers "no records" with 204 and an empty body
+            if response.status_code == 204 or not response.content:
+                return []
             try:
-                return response.json()
-            except ValueError:
-                raise ConnectionError(f"API response was not JSON. Response: {response.text[:200]}")
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                raise WoRMSRequestError(f"API response was not JSON. Response: {response.text[:200]}")
+        except requests.exceptions.Timeout as e:
+            raise WoRMSTimeoutError(f"API request timed out: {e}")
+        except requests.exceptions.HTTPError as e:
+            raise WoRMSRequestError(f"API request failed: {e}", status=e.response.status_code if e.response is not None else None)
         except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"API request failed: {e}")
-
-
-    def get_species_aphia_id(self, scientific_name: str) -> Optional[int]:
-        """Get AphiaID for a species name - synchronous helper"""
+            raise WoRMSRequestError(f"API request failed: {e}")
+        
+        self._remember_validators(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), data)
+        if disk_cache is not None:
+            disk_cache.set(url, data)
+        return data
+
+    def species_url(self, endpoint: str, aphia_id: int, build_url: Callable[["WoRMS", int], str]) -> str:
+        """
+        URL of a per-species endpoint, memoized by (endpoint, aphia_id) so repeat lookups
+        return the finished string; build_url(self, aphia_id) is only called on a miss
+        """
+        key = (endpoint, aphia_id)
+        url = self._species_urls.get(key)
+        if url is None:
+            url = self._species_urls[key] = build_url(self, aphia_id)
+            if len(self._species_urls) > SPECIES_URL_CACHE_SIZE:
+                self._species_urls.popitem(last=False)
+        else:
+            self._species_urls.move_to_end(key)
+        return url
+
+    def _remember_validators(self, url: str, etag: Optional[str], last_modified: Optional[str], data: Any) -> None:
+        """Keep the response validators so the next fetch of url can be conditional"""
+        if not etag and not last_modified:
+            return
+        with self._validator_lock:
+            self._validator_cache[url] = (etag, last_modified, data)
+            self._validator_cache.move_to_end(url)
+            while len(self._validator_cache) > self._validator_cache_size:
+                self._validator_cache.popitem(last=False)
+
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call on the WoRMS worker pool, preserving the caller's contextvars"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, context.run, func, *args)
+
+    async def execute_request_async(self, url: str, cacheable: Optional[bool] = None) -> Dict:
+        """
+        Execute GET request without blocking the event loop, serving repeats from the response cache.
+        Non-cacheable URLs (see is_cacheable_url) always go to WoRMS.
+        """
+        if cacheable is None:
+            cacheable = is_cacheable_url(url)
+        if not cacheable:
+            return await self._run_blocking(self.execute_request, url, False)
+        return await self._response_cache.get_or_load(url, self._run_blocking, self.execute_request, url)
+
+
+    async def get_species_aphia_id_async(self, scientific_name: str) -> Optional[int]:
+        """
+        Get AphiaID for a species name without blocking the event loop.
+        Goes through the response cache, so names WoRMS does not know are answered
+        locally on repeat lookups, while failed requests are retried.
+        """
         params = SpeciesSearchParams(scientific_name=scientific_name)
         url = self.build_species_search_url(params)
         
         try:
-            result = self.execute_request(url)
-            if isinstance(result, list) and result:
-                return result[0].get('AphiaID')
-            elif isinstance(result, dict):
-                return result.get('AphiaID')
-            return None
+            return self._first_aphia_id(await self.execute_request_async(url))
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _first_aphia_id(result: Any) -> Optional[int]:
+        """AphiaID of the best match in a name search response"""
+        if isinstance(result, list) and result:
+            return result[0].get('AphiaID')
+        elif isinstance(result, dict):
+            return result.get('AphiaID')
+        return None
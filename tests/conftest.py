@@ -36,8 +36,10 @@ TEST_CONTEXT_ID = "617727d1-4ce8-4902-884c-db786854b51c"
 
 @pytest.fixture(scope="function")
 def agent():
-    """Create a fresh WoRMS agent instance for each test."""
-    return WoRMSReActAgent()
+    """Create a fresh WoRMS agent instance for each test, closed afterwards."""
+    agent = WoRMSReActAgent()
+    yield agent
+    agent.close()
 
 
 @pytest.fixture(scope="function")
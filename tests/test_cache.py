@@ -0,0 +1,125 @@
+"""
+Unit tests for the in-process WoRMS lookup cache.
+These run offline - no WoRMS or LLM calls.
+"""
+import asyncio
+import pytest
+from src.cache import AsyncTTLCache, SQLiteResponseCache, normalize_species_name
+
+
+def test_normalize_species_name():
+    """Case and whitespace variants of a name share one cache key"""
+    assert normalize_species_name("  Orcinus   orca ") == "orcinus orca"
+    assert normalize_species_name("ORCINUS ORCA") == normalize_species_name("Orcinus orca")
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_result():
+    """A second lookup for the same key is served from the cache"""
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return 137205
+
+    assert await cache.get_or_load("orcinus orca", loader) == 137205
+    assert await cache.get_or_load("orcinus orca", loader) == 137205
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_passes_arguments():
+    """Loader arguments are passed through instead of bound in a closure"""
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+
+    async def loader(name, offset=0):
+        return f"{name}:{offset}"
+
+    assert await cache.get_or_load("orcinus orca", loader, "Orcinus orca", 51) == "Orcinus orca:51"
+    assert await cache.get_or_load("orcinus orca", loader, "ignored") == "Orcinus orca:51"
+
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached():
+    """Failed lookups (None) are retried on the next call"""
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return None
+
+    await cache.get_or_load("fakeus nonexistentus", loader)
+    await cache.get_or_load("fakeus nonexistentus", loader)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Concurrent callers for the same key await a single in-flight load"""
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 137205
+
+    results = await asyncio.gather(*(cache.get_or_load("orcinus orca", loader) for _ in range(5)))
+    assert results == [137205] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_and_evicted_entries():
+    """Entries past their TTL or beyond maxsize are dropped"""
+    expired = AsyncTTLCache(maxsize=8, ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+    bounded = AsyncTTLCache(maxsize=2, ttl=60)
+    bounded.set("a", 1)
+    bounded.set("b", 2)
+    bounded.get("a")
+    bounded.set("c", 3)
+    assert bounded.get("a") == 1
+    assert bounded.get("b") is None
+    assert len(bounded) == 2
+
+
+@pytest.fixture
+def open_cache(tmp_path):
+    """Open SQLiteResponseCache connections on one database file, all closed after the test"""
+    caches = []
+
+    def open_(ttl: float = 30 * 86400) -> SQLiteResponseCache:
+        caches.append(SQLiteResponseCache(str(tmp_path / "worms.sqlite3"), ttl=ttl))
+        return caches[-1]
+
+    yield open_
+    for cache in caches:
+        cache.close()
+
+
+def test_sqlite_cache_round_trip(open_cache):
+    """Stored responses are readable from a new connection until they expire"""
+    url = "https://www.marinespecies.org/rest/AphiaChildrenByAphiaID/137205"
+    open_cache().set(url, [{"AphiaID": 137205, "rank": "Species"}])
+
+    assert open_cache().get(url) == [{"AphiaID": 137205, "rank": "Species"}]
+    assert open_cache(ttl=0).get(url) is None
+    assert open_cache().get(url + "?offset=51") is None
+
+
+def test_sqlite_cache_drops_corrupt_rows(open_cache):
+    """A row that no longer decodes is a miss and is removed, so the next request refetches"""
+    cache = open_cache()
+    url = "https://www.marinespecies.org/rest/AphiaRecordByAphiaID/137205"
+    cache._conn.execute(
+        "INSERT INTO worms_responses (url, payload, fetched_at) VALUES (?, ?, ?)",
+        (url, b"not zlib", 9e18),
+    )
+
+    assert cache.get(url) is None
+    assert cache._conn.execute("SELECT COUNT(*) FROM worms_responses").fetchone()[0] == 0
@@ -0,0 +1,17 @@
+"""
+Unit tests for the WoRMS tool helpers.
+These run offline - no WoRMS or LLM calls.
+"""
+from src.tools import WORMS_PAGE_SIZE, _children_metadata
+
+
+def test_children_metadata_pagination():
+    """A full page advertises the offset of the next page; a short page is the last one"""
+    full_page = [{"rank": "Species"}] * WORMS_PAGE_SIZE
+
+    assert _children_metadata(full_page)["next_offset"] == WORMS_PAGE_SIZE + 1
+    assert _children_metadata(full_page, offset=51)["next_offset"] == 51 + WORMS_PAGE_SIZE
+    assert _children_metadata(full_page, offset=0)["next_offset"] == WORMS_PAGE_SIZE + 1
+    assert _children_metadata(full_page, offset=-10)["next_offset"] == WORMS_PAGE_SIZE + 1
+    assert "next_offset" not in _children_metadata([{"rank": "Subspecies"}, {"rank": "Form"}])
+    assert _children_metadata([{"rank": "Subspecies"}, {"rank": "Form"}, {}])["ranks"] == ["Form", "Subspecies"]
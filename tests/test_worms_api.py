@@ -0,0 +1,217 @@
+"""
+Unit tests for the WoRMS API helpers.
+These run offline - no WoRMS or LLM calls.
+"""
+import contextlib
+import http.server
+import threading
+import time
+import pytest
+import requests
+from src.cache import SQLiteResponseCache
+from src.worms_api import WoRMS, WoRMSRequestError, WoRMSTimeoutError, ChildrenParams, is_valid_species_name
+
+
+@pytest.fixture
+def worms():
+    """A WoRMS client for one test, closed afterwards so its worker pool and session do not leak"""
+    client = WoRMS()
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize("name", [
+    "Orcinus orca",
+    "Mytilus (Mytilus) edulis",
+    "Alexandrium sp. 1",
+    "Acropora × prolifera",
+])
+def test_valid_species_names(name):
+    """Real taxon name shapes pass the pre-check"""
+    assert is_valid_species_name(name)
+
+
+@pytest.mark.parametrize("name", ["", "   ", "123", "a", "x\x00y", "DROP TABLE;"])
+def test_invalid_species_names(name):
+    """Names WoRMS cannot match are rejected before any request"""
+    assert not is_valid_species_name(name)
+
+
+def test_species_urls_are_memoized_per_client(worms):
+    """A per-species URL is built once per client and never shared with another client"""
+    built = []
+
+    def build_url(client, aphia_id):
+        built.append(client)
+        return client.build_children_url(ChildrenParams.model_construct(aphia_id=aphia_id, offset=1))
+
+    url = worms.species_url("get_child_taxa", 137205, build_url)
+    assert worms.species_url("get_child_taxa", 137205, build_url) == url
+    assert built == [worms]
+
+    other = WoRMS()
+    try:
+        assert other.species_url("get_child_taxa", 137205, build_url) == url
+        assert built == [worms, other]
+    finally:
+        other.close()
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_are_served_from_cache(monkeypatch, worms):
+    """A second request for the same URL does not hit WoRMS again"""
+    calls = []
+
+    def fake_execute(url):
+        calls.append(url)
+        return [{"AphiaID": 137205}]
+
+    monkeypatch.setattr(worms, "execute_request", fake_execute)
+    url = worms.build_children_url(ChildrenParams(aphia_id=137205))
+
+    assert await worms.execute_request_async(url) == [{"AphiaID": 137205}]
+    assert await worms.execute_request_async(url) == [{"AphiaID": 137205}]
+    assert calls == [url]
+
+
+@pytest.mark.asyncio
+async def test_date_dependent_requests_bypass_response_cache(monkeypatch, worms):
+    """Open-ended AphiaRecordsByDate queries are refetched instead of served from memory"""
+    calls = []
+
+    def fake_execute(url, cacheable=None):
+        calls.append((url, cacheable))
+        return []
+
+    monkeypatch.setattr(worms, "execute_request", fake_execute)
+    url = "https://www.marinespecies.org/rest/AphiaRecordsByDate?startdate=2024-01-01"
+
+    await worms.execute_request_async(url)
+    await worms.execute_request_async(url)
+    assert calls == [(url, False), (url, False)]
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_cached(monkeypatch, worms):
+    """Errors propagate and the next call retries the request"""
+    calls = []
+
+    def failing_execute(url):
+        calls.append(url)
+        raise ConnectionError("API request failed: 503")
+
+    monkeypatch.setattr(worms, "execute_request", failing_execute)
+    url = worms.build_children_url(ChildrenParams(aphia_id=137205))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await worms.execute_request_async(url)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_names_are_answered_from_cache(monkeypatch, worms):
+    """A name WoRMS has no match for is only looked up once"""
+    calls = []
+
+    def fake_execute(url):
+        calls.append(url)
+        return []
+
+    monkeypatch.setattr(worms, "execute_request", fake_execute)
+
+    assert await worms.get_species_aphia_id_async("Fakeus nonexistentus") is None
+    assert await worms.get_species_aphia_id_async("Fakeus nonexistentus") is None
+    assert len(calls) == 1
+
+
+def test_http_errors_carry_status(monkeypatch, worms):
+    """HTTP failures raise WoRMSRequestError with the status code, timeouts their own subclass"""
+    response = requests.Response()
+    response.status_code = 503
+
+    monkeypatch.setattr(worms.session, "get", lambda *args, **kwargs: response)
+    with pytest.raises(WoRMSRequestError) as excinfo:
+        worms.execute_request("https://www.marinespecies.org/rest/AphiaRecordByAphiaID/137205")
+    assert excinfo.value.status == 503
+
+    def timeout(*args, **kwargs):
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(worms.session, "get", timeout)
+    with pytest.raises(WoRMSTimeoutError):
+        worms.execute_request("https://www.marinespecies.org/rest/AphiaRecordByAphiaID/137205")
+
+
+@contextlib.contextmanager
+def local_worms(worms, respond):
+    """
+    Serve respond(hit_number) -> (status, headers, body) on localhost, routed through the adapter
+    WoRMS traffic uses. Yields (url, hits), where hits records every request the server received.
+    """
+    hits = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            status, headers, body = respond(len(hits))
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    worms.session.mount("http://", worms.session.get_adapter("https://"))
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/rest/AphiaRecordByAphiaID/137205", hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_transient_errors_are_retried(worms):
+    """A 503 from WoRMS is retried on the pooled adapter instead of failing the tool call"""
+    def respond(hit):
+        return (503, {}, b"") if hit == 1 else (200, {}, b'[{"AphiaID": 137205}]')
+
+    with local_worms(worms, respond) as (url, hits):
+        assert worms.execute_request(url) == [{"AphiaID": 137205}]
+        assert len(hits) == 2
+
+
+def test_retry_after_does_not_block_workers(worms):
+    """A long Retry-After is not slept on - retries use the capped backoff and then fail with the status"""
+    with local_worms(worms, lambda hit: (503, {"Retry-After": "3600"}, b"")) as (url, hits):
+        started = time.monotonic()
+        with pytest.raises(WoRMSRequestError) as excinfo:
+            worms.execute_request(url)
+        assert time.monotonic() - started < 5
+        assert excinfo.value.status == 503
+        assert len(hits) == 4
+
+
+def test_date_dependent_responses_skip_disk_cache(monkeypatch, tmp_path, worms):
+    """Open-ended AphiaRecordsByDate answers change over time and are always refetched"""
+    worms._disk_cache = SQLiteResponseCache(str(tmp_path / "worms.sqlite3"))
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'[{"AphiaID": 137205}]'
+        return response
+
+    monkeypatch.setattr(worms.session, "get", fake_get)
+    record_url = "https://www.marinespecies.org/rest/AphiaRecordByAphiaID/137205"
+    recent_url = "https://www.marinespecies.org/rest/AphiaRecordsByDate?startdate=2024-01-01"
+
+    for url in (record_url, record_url, recent_url, recent_url):
+        assert worms.execute_request(url) == [{"AphiaID": 137205}]
+    assert calls == [record_url, recent_url, recent_url]